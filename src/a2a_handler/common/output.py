@@ -9,10 +9,10 @@ import json as json_module
 import sys
 from typing import Any, TextIO
 
-TERMINAL_STATES = {"completed", "failed", "canceled", "rejected"}
-SUCCESS_STATES = {"completed"}
-ERROR_STATES = {"failed", "rejected"}
-WARNING_STATES = {"canceled"}
+TERMINAL_STATES = frozenset({"completed", "failed", "canceled", "rejected"})
+SUCCESS_STATES = frozenset({"completed"})
+ERROR_STATES = frozenset({"failed", "rejected"})
+WARNING_STATES = frozenset({"canceled"})
 
 # Basic ANSI color codes
 RESET = "\033[0m"
@@ -40,8 +40,15 @@ class Output:
     markdown with automatic color formatting when supported.
     """
 
-    def __init__(self) -> None:
-        self._use_color = _supports_color(sys.stdout)
+    def __init__(self, use_color: bool | None = None) -> None:
+        """Initialize the output manager.
+
+        Args:
+            use_color: Force color on or off; detected from stdout when None
+        """
+        if use_color is None:
+            use_color = _supports_color(sys.stdout)
+        self._use_color = use_color
 
     def _style(self, text: str, *codes: str) -> str:
         """Apply ANSI codes if color is enabled."""
@@ -32,12 +32,14 @@ from a2a_handler.common import get_logger
 
 logger = get_logger(__name__)
 
-TERMINAL_TASK_STATES = {
-    TaskState.completed,
-    TaskState.canceled,
-    TaskState.failed,
-    TaskState.rejected,
-}
+TERMINAL_TASK_STATES: frozenset[TaskState] = frozenset(
+    {
+        TaskState.completed,
+        TaskState.canceled,
+        TaskState.failed,
+        TaskState.rejected,
+    }
+)
 
 
 @dataclass
@@ -176,6 +178,10 @@ def extract_text_from_message_parts(message_parts: list[Part] | None) -> str:
     if not message_parts:
         return ""
 
+    if len(message_parts) == 1:
+        part_root = message_parts[0].root
+        return part_root.text if isinstance(part_root, TextPart) else ""
+
     extracted_texts = []
     for part in message_parts:
         if isinstance(part.root, TextPart):
@@ -1,7 +1,5 @@
 """Tests for CLI auth commands."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -19,11 +17,9 @@ def runner():
 
 
 @pytest.fixture
-def temp_session_store():
+def temp_session_store(tmp_path):
     """Create a temporary session store for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        store = SessionStore(session_directory=Path(temp_dir))
-        yield store
+    return SessionStore(session_directory=tmp_path)
 
 
 class TestAuthSet:
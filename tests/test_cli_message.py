@@ -59,8 +59,21 @@ class TestMessageSend:
             assert result.exit_code == 0
             assert "Response text" in result.output
 
-    def test_message_send_with_context_id(self, runner):
-        """Test message send with context ID."""
+    @pytest.mark.parametrize(
+        "extra_args,assert_kw,assert_val",
+        [
+            (["--context-id", "ctx-456"], "send_args", ("Hello", "ctx-456", None)),
+            (["--bearer", "my-token"], "credentials_nonnone", None),
+            (
+                ["--push-url", "http://webhook.example.com"],
+                "push_notification_url",
+                "http://webhook.example.com",
+            ),
+        ],
+        ids=["context-id", "bearer", "push-url"],
+    )
+    def test_message_send_with_option(self, runner, extra_args, assert_kw, assert_val):
+        """Test message send passes CLI options through to the service."""
         mock_task = _make_task(TaskState.completed)
         mock_result = SendResult(task=mock_task, text="Response")
 
@@ -80,17 +93,17 @@ class TestMessageSend:
 
             result = runner.invoke(
                 message,
-                [
-                    "send",
-                    "http://localhost:8000",
-                    "Hello",
-                    "--context-id",
-                    "ctx-456",
-                ],
+                ["send", "http://localhost:8000", "Hello", *extra_args],
             )
 
             assert result.exit_code == 0
-            mock_service.send.assert_called_once_with("Hello", "ctx-456", None)
+            call_kwargs = mock_service_cls.call_args.kwargs
+            if assert_kw == "send_args":
+                mock_service.send.assert_called_once_with(*assert_val)
+            elif assert_kw == "credentials_nonnone":
+                assert call_kwargs["credentials"] is not None
+            else:
+                assert call_kwargs[assert_kw] == assert_val
 
     def test_message_send_with_continue_flag(self, runner):
         """Test message send with --continue flag uses session."""
@@ -127,74 +140,6 @@ class TestMessageSend:
             assert result.exit_code == 0
             mock_service.send.assert_called_once_with("Hello", "saved-ctx", None)
 
-    def test_message_send_with_bearer_auth(self, runner):
-        """Test message send with bearer token."""
-        mock_task = _make_task(TaskState.completed)
-        mock_result = SendResult(task=mock_task, text="Response")
-
-        with (
-            patch("a2a_handler.cli.message.build_http_client") as mock_client,
-            patch("a2a_handler.cli.message.A2AService") as mock_service_cls,
-            patch("a2a_handler.cli.message.update_session"),
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.send.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                message,
-                [
-                    "send",
-                    "http://localhost:8000",
-                    "Hello",
-                    "--bearer",
-                    "my-token",
-                ],
-            )
-
-            assert result.exit_code == 0
-            call_kwargs = mock_service_cls.call_args.kwargs
-            assert call_kwargs["credentials"] is not None
-
-    def test_message_send_with_push_url(self, runner):
-        """Test message send with push notification URL."""
-        mock_task = _make_task(TaskState.completed)
-        mock_result = SendResult(task=mock_task, text="Response")
-
-        with (
-            patch("a2a_handler.cli.message.build_http_client") as mock_client,
-            patch("a2a_handler.cli.message.A2AService") as mock_service_cls,
-            patch("a2a_handler.cli.message.update_session"),
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.send.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                message,
-                [
-                    "send",
-                    "http://localhost:8000",
-                    "Hello",
-                    "--push-url",
-                    "http://webhook.example.com",
-                ],
-            )
-
-            assert result.exit_code == 0
-            call_kwargs = mock_service_cls.call_args.kwargs
-            assert call_kwargs["push_notification_url"] == "http://webhook.example.com"
-
     def test_message_send_connection_error(self, runner):
         """Test message send handles connection errors."""
         import httpx
@@ -1,10 +1,18 @@
 """Tests for the Output class and related utilities."""
 
+from datetime import datetime
 from io import StringIO
+from unittest.mock import patch
 
 import pytest
 
 from a2a_handler.common.output import (
+    BOLD,
+    CYAN,
+    DIM,
+    GREEN,
+    RED,
+    RESET,
     Output,
     _supports_color,
     TERMINAL_STATES,
@@ -14,36 +22,40 @@ from a2a_handler.common.output import (
 )
 
 
+class _TTYStream(StringIO):
+    """Stream that reports itself as a TTY."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+class _NonTTYStream(StringIO):
+    """Stream that reports itself as not a TTY."""
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _NoIsatty:
+    """Object without an isatty method."""
+
+
 class TestSupportsColor:
     """Tests for _supports_color function."""
 
     def test_supports_color_with_tty(self):
         """Test that _supports_color returns True for TTY."""
-
-        class MockTTYStream(StringIO):
-            def isatty(self) -> bool:
-                return True
-
-        result = _supports_color(MockTTYStream())  # type: ignore[arg-type]
+        result = _supports_color(_TTYStream())  # type: ignore[arg-type]
         assert result is True
 
     def test_supports_color_without_tty(self):
         """Test that _supports_color returns False for non-TTY."""
-
-        class MockNonTTYStream(StringIO):
-            def isatty(self) -> bool:
-                return False
-
-        result = _supports_color(MockNonTTYStream())  # type: ignore[arg-type]
+        result = _supports_color(_NonTTYStream())  # type: ignore[arg-type]
         assert result is False
 
     def test_supports_color_no_isatty_method(self):
         """Test that _supports_color returns False when isatty is missing."""
-
-        class NoIsatty:
-            pass
-
-        result = _supports_color(NoIsatty())  # type: ignore[arg-type]
+        result = _supports_color(_NoIsatty())  # type: ignore[arg-type]
         assert result is False
 
 
@@ -74,206 +86,156 @@ class TestStateConstants:
 class TestOutput:
     """Tests for Output class."""
 
-    @pytest.fixture
-    def output(self):
+    @pytest.fixture(scope="class")
+    def _captured(self):
+        """Create the list that receives printed output for the class."""
+        return []
+
+    @pytest.fixture(scope="class")
+    def output(self, _captured):
         """Create an Output instance for testing."""
-        output = Output()
-        output._use_color = False
+        output = Output(use_color=False)
+        output._print = _captured.append
         return output
 
     @pytest.fixture
-    def captured_output(self, output):
-        """Create output capture context."""
-        captured = []
-
-        def capture_print(text):
-            captured.append(text)
-
-        output._print = capture_print
-        return captured
-
-    def test_line_basic(self, output, captured_output):
-        """Test basic line output."""
-        output.line("Hello, world!")
-        assert captured_output == ["Hello, world!"]
-
-    def test_line_with_style(self, output, captured_output):
-        """Test line output with style (no color mode)."""
-        output.line("Styled text", style="green")
-        assert captured_output == ["Styled text"]
+    def captured_output(self, _captured):
+        """Reset and return the captured output for each test."""
+        _captured.clear()
+        return _captured
+
+    def test_use_color_overrides_detection(self):
+        """Test that an explicit use_color skips TTY detection."""
+        with patch("a2a_handler.common.output._supports_color") as mock_supports:
+            output = Output(use_color=True)
+
+        assert output._use_color is True
+        mock_supports.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method,args,expected",
+        [
+            ("line", ("Hello, world!",), "Hello, world!"),
+            ("line", ("Styled text", "green"), "Styled text"),
+            ("subheader", ("Sub Section",), "Sub Section"),
+            ("blank", (), ""),
+            ("success", ("Operation successful!",), "Operation successful!"),
+            ("error", ("Something went wrong!",), "Something went wrong!"),
+            ("warning", ("Be careful!",), "Be careful!"),
+            ("dim", ("Muted text",), "Muted text"),
+            (
+                "markdown",
+                ("# Header\n\nParagraph text",),
+                "# Header\n\nParagraph text",
+            ),
+        ],
+        ids=[
+            "line",
+            "line-styled",
+            "subheader",
+            "blank",
+            "success",
+            "error",
+            "warning",
+            "dim",
+            "markdown",
+        ],
+    )
+    def test_passthrough_lines(self, output, captured_output, method, args, expected):
+        """Test methods that print their text unchanged without color."""
+        getattr(output, method)(*args)
+        assert captured_output == [expected]
 
     def test_field_basic(self, output, captured_output):
         """Test basic field output."""
         output.field("Name", "Value")
-        assert len(captured_output) == 1
-        assert "Name:" in captured_output[0]
-        assert "Value" in captured_output[0]
+        assert captured_output == ["Name: Value"]
 
     def test_field_with_none_value(self, output, captured_output):
         """Test field with None value."""
         output.field("Name", None)
-        assert "none" in captured_output[0]
+        assert captured_output == ["Name: none"]
 
     def test_header(self, output, captured_output):
         """Test header output."""
         output.header("Section Title")
-        assert len(captured_output) == 1
-        assert "Section Title" in captured_output[0]
+        assert captured_output == ["\nSection Title"]
 
-    def test_subheader(self, output, captured_output):
-        """Test subheader output."""
-        output.subheader("Sub Section")
-        assert captured_output == ["Sub Section"]
-
-    def test_blank(self, output, captured_output):
-        """Test blank line output."""
-        output.blank()
-        assert captured_output == [""]
-
-    def test_state_completed(self, output, captured_output):
-        """Test state output for completed."""
-        output.state("Status", "completed")
-        assert len(captured_output) == 1
-        assert "Status:" in captured_output[0]
-        assert "completed" in captured_output[0]
-
-    def test_state_failed(self, output, captured_output):
-        """Test state output for failed."""
-        output.state("Status", "failed")
-        assert "failed" in captured_output[0]
-
-    def test_state_canceled(self, output, captured_output):
-        """Test state output for canceled."""
-        output.state("Status", "canceled")
-        assert "canceled" in captured_output[0]
-
-    def test_state_working(self, output, captured_output):
-        """Test state output for working."""
-        output.state("Status", "working")
-        assert "working" in captured_output[0]
-
-    def test_success(self, output, captured_output):
-        """Test success message."""
-        output.success("Operation successful!")
-        assert captured_output == ["Operation successful!"]
-
-    def test_error(self, output, captured_output):
-        """Test error message."""
-        output.error("Something went wrong!")
-        assert captured_output == ["Something went wrong!"]
-
-    def test_warning(self, output, captured_output):
-        """Test warning message."""
-        output.warning("Be careful!")
-        assert captured_output == ["Be careful!"]
-
-    def test_dim(self, output, captured_output):
-        """Test dim message."""
-        output.dim("Muted text")
-        assert captured_output == ["Muted text"]
+    @pytest.mark.parametrize("state", ["completed", "failed", "canceled", "working"])
+    def test_state(self, output, captured_output, state):
+        """Test state output for each state category."""
+        output.state("Status", state)
+        assert captured_output == [f"Status: {state}"]
 
     def test_json(self, output, captured_output):
         """Test JSON output."""
         output.json({"key": "value"})
-        assert len(captured_output) == 1
-        assert '"key"' in captured_output[0]
-        assert '"value"' in captured_output[0]
+        assert captured_output == ['{\n  "key": "value"\n}']
 
     def test_json_with_non_serializable(self, output, captured_output):
         """Test JSON output with non-serializable type (uses default=str)."""
-        from datetime import datetime
-
         now = datetime.now()
         output.json({"time": now})
         assert len(captured_output) == 1
 
-    def test_markdown(self, output, captured_output):
-        """Test markdown output."""
-        output.markdown("# Header\n\nParagraph text")
-        assert captured_output == ["# Header\n\nParagraph text"]
-
     def test_list_item(self, output, captured_output):
         """Test list item output."""
         output.list_item("First item")
-        assert "•" in captured_output[0]
-        assert "First item" in captured_output[0]
+        assert captured_output == ["  • First item"]
 
     def test_list_item_custom_bullet(self, output, captured_output):
         """Test list item with custom bullet."""
         output.list_item("Item", bullet="→")
-        assert "→" in captured_output[0]
-        assert "Item" in captured_output[0]
+        assert captured_output == ["  → Item"]
 
 
 class TestOutputWithColor:
     """Tests for Output class with color enabled."""
 
-    @pytest.fixture
-    def color_output(self):
+    @pytest.fixture(scope="class")
+    def _captured(self):
+        """Create the list that receives printed output for the class."""
+        return []
+
+    @pytest.fixture(scope="class")
+    def color_output(self, _captured):
         """Create an Output instance with color enabled."""
-        output = Output()
-        output._use_color = True
+        output = Output(use_color=True)
+        output._print = _captured.append
         return output
 
     @pytest.fixture
-    def captured_output(self, color_output):
-        """Create output capture context."""
-        captured = []
-
-        def capture_print(text):
-            captured.append(text)
-
-        color_output._print = capture_print
-        return captured
+    def captured_output(self, _captured):
+        """Reset and return the captured output for each test."""
+        _captured.clear()
+        return _captured
 
     def test_line_with_style_applies_color(self, color_output, captured_output):
         """Test that styled lines apply ANSI codes."""
-        from a2a_handler.common.output import GREEN, RESET
-
         color_output.line("Green text", style="green")
-        assert len(captured_output) == 1
-        assert GREEN in captured_output[0]
-        assert RESET in captured_output[0]
+        assert captured_output == [f"{GREEN}Green text{RESET}"]
 
     def test_error_applies_red_bold(self, color_output, captured_output):
         """Test that error applies red and bold."""
-        from a2a_handler.common.output import RED, BOLD, RESET
-
         color_output.error("Error message")
-        assert len(captured_output) == 1
-        assert RED in captured_output[0]
-        assert BOLD in captured_output[0]
-        assert RESET in captured_output[0]
+        assert captured_output == [f"{RED}{BOLD}Error message{RESET}"]
 
     def test_header_applies_bold(self, color_output, captured_output):
         """Test that header applies bold."""
-        from a2a_handler.common.output import BOLD, RESET
-
         color_output.header("Title")
-        assert len(captured_output) == 1
-        assert BOLD in captured_output[0]
-        assert RESET in captured_output[0]
+        assert captured_output == [f"\n{BOLD}Title{RESET}"]
 
     def test_field_with_dim_value(self, color_output, captured_output):
         """Test field with dimmed value."""
-        from a2a_handler.common.output import DIM
-
         color_output.field("Name", "Value", dim_value=True)
-        assert len(captured_output) == 1
-        assert DIM in captured_output[0]
+        assert captured_output == [f"{BOLD}Name:{RESET} {DIM}Value{RESET}"]
 
     def test_field_with_value_style(self, color_output, captured_output):
         """Test field with specific value style."""
-        from a2a_handler.common.output import CYAN
-
         color_output.field("Name", "Value", value_style="cyan")
-        assert len(captured_output) == 1
-        assert CYAN in captured_output[0]
+        assert captured_output == [f"{BOLD}Name:{RESET} {CYAN}Value{RESET}"]
 
     def test_state_applies_appropriate_color(self, color_output, captured_output):
         """Test state applies color based on state type."""
-        from a2a_handler.common.output import GREEN
-
         color_output.state("Status", "completed")
-        assert len(captured_output) == 1
-        assert GREEN in captured_output[0]
+        assert captured_output == [f"{BOLD}Status:{RESET} {GREEN}completed{RESET}"]
@@ -1,6 +1,21 @@
 """Tests for the A2A service layer module."""
 
-from a2a.types import Message, Part, Role, Task, TaskState, TaskStatus, TextPart
+import functools
+
+import pytest
+from a2a.types import (
+    Artifact,
+    DataPart,
+    Message,
+    Part,
+    Role,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
 
 from a2a_handler.service import (
     SendResult,
@@ -8,87 +23,183 @@ from a2a_handler.service import (
     TaskResult,
     TERMINAL_TASK_STATES,
     extract_text_from_message_parts,
+    extract_text_from_task,
 )
 
 
 def _make_task(
     state: TaskState, task_id: str = "task-123", context_id: str = "ctx-123"
 ) -> Task:
-    """Helper to create a Task with the given state."""
-    return Task(
+    """Helper to create a Task with the given state, skipping validation."""
+    return Task.model_construct(
         id=task_id,
         context_id=context_id,
-        status=TaskStatus(state=state),
+        status=TaskStatus.model_construct(state=state),
     )
 
 
 def _make_message(context_id: str = "ctx-123", task_id: str | None = None) -> Message:
-    """Helper to create a Message."""
-    return Message(
+    """Helper to create a Message, skipping validation."""
+    return Message.model_construct(
         message_id="msg-123",
         role=Role.agent,
-        parts=[Part(root=TextPart(text="Hello"))],
+        parts=[Part.model_construct(root=TextPart.model_construct(text="Hello"))],
         context_id=context_id,
         task_id=task_id,
     )
 
 
+_TERMINAL_CASES = (
+    pytest.param(TaskState.completed, True, id="completed"),
+    pytest.param(TaskState.canceled, True, id="canceled"),
+    pytest.param(TaskState.failed, True, id="failed"),
+    pytest.param(TaskState.rejected, True, id="rejected"),
+    pytest.param(TaskState.working, False, id="working"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parts(*texts: str) -> tuple[Part, ...]:
+    """Helper to create text Parts once per distinct set of texts."""
+    return tuple(Part(root=TextPart(text=text)) for text in texts)
+
+
+@pytest.fixture(scope="module")
+def task_by_state() -> dict[TaskState, Task]:
+    """Build one read-only Task per TaskState for the module."""
+    return {state: _make_task(state) for state in TaskState}
+
+
+@pytest.fixture(scope="module")
+def agent_message() -> Message:
+    """Build a read-only agent Message for the module."""
+    return _make_message(context_id="ctx-789", task_id="task-789")
+
+
+@pytest.fixture(scope="module")
+def task_with_artifact() -> Task:
+    """Build a completed Task with a single text artifact."""
+    return Task(
+        id="task-123",
+        context_id="ctx-123",
+        status=TaskStatus(state=TaskState.completed),
+        artifacts=[
+            Artifact(
+                artifact_id="art-1",
+                parts=[Part(root=TextPart(text="Artifact text"))],
+            )
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def task_with_history() -> Task:
+    """Build a completed Task with agent history and no artifacts."""
+    return Task(
+        id="task-123",
+        context_id="ctx-123",
+        status=TaskStatus(state=TaskState.completed),
+        artifacts=[],
+        history=[
+            Message(
+                message_id="msg-1",
+                role=Role.agent,
+                parts=[Part(root=TextPart(text="History text"))],
+                context_id="ctx-123",
+            )
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def task_with_both(task_with_artifact, task_with_history) -> Task:
+    """Build a completed Task with both artifacts and agent history."""
+    return task_with_artifact.model_copy(update={"history": task_with_history.history})
+
+
+@pytest.fixture(scope="module")
+def task_with_user_and_agent() -> Task:
+    """Build a completed Task whose history has user and agent messages."""
+    return Task(
+        id="task-123",
+        context_id="ctx-123",
+        status=TaskStatus(state=TaskState.completed),
+        artifacts=[],
+        history=[
+            Message(
+                message_id="msg-1",
+                role=Role.user,
+                parts=[Part(root=TextPart(text="User text"))],
+                context_id="ctx-123",
+            ),
+            Message(
+                message_id="msg-2",
+                role=Role.agent,
+                parts=[Part(root=TextPart(text="Agent text"))],
+                context_id="ctx-123",
+            ),
+        ],
+    )
+
+
 class TestSendResult:
     """Tests for SendResult dataclass."""
 
-    def test_is_complete_when_completed(self):
-        """Test is_complete returns True for completed state."""
-        result = SendResult(task=_make_task(TaskState.completed))
-        assert result.is_complete is True
-
-    def test_is_complete_when_canceled(self):
-        """Test is_complete returns True for canceled state."""
-        result = SendResult(task=_make_task(TaskState.canceled))
-        assert result.is_complete is True
-
-    def test_is_complete_when_failed(self):
-        """Test is_complete returns True for failed state."""
-        result = SendResult(task=_make_task(TaskState.failed))
-        assert result.is_complete is True
-
-    def test_is_complete_when_rejected(self):
-        """Test is_complete returns True for rejected state."""
-        result = SendResult(task=_make_task(TaskState.rejected))
-        assert result.is_complete is True
-
-    def test_is_complete_when_working(self):
-        """Test is_complete returns False for working state."""
-        result = SendResult(task=_make_task(TaskState.working))
-        assert result.is_complete is False
+    @pytest.mark.parametrize("state,expected", _TERMINAL_CASES)
+    def test_is_complete(self, task_by_state, state, expected):
+        """Test is_complete is True only for terminal states."""
+        result = SendResult(task=task_by_state[state])
+        assert result.is_complete is expected
 
     def test_is_complete_when_no_state(self):
         """Test is_complete returns False when no task or message."""
         result = SendResult()
         assert result.is_complete is False
 
-    def test_needs_input_when_input_required(self):
-        """Test needs_input returns True for input_required state."""
-        result = SendResult(task=_make_task(TaskState.input_required))
-        assert result.needs_input is True
-
-    def test_needs_input_when_working(self):
-        """Test needs_input returns False for working state."""
-        result = SendResult(task=_make_task(TaskState.working))
-        assert result.needs_input is False
+    @pytest.mark.parametrize(
+        "state,expected",
+        [
+            (TaskState.input_required, True),
+            (TaskState.working, False),
+        ],
+        ids=["input_required", "working"],
+    )
+    def test_needs_input(self, task_by_state, state, expected):
+        """Test needs_input is True only for input_required state."""
+        result = SendResult(task=task_by_state[state])
+        assert result.needs_input is expected
 
     def test_needs_input_when_no_state(self):
         """Test needs_input returns False when no task or message."""
         result = SendResult()
         assert result.needs_input is False
 
+    @pytest.mark.parametrize(
+        "state,expected",
+        [
+            (TaskState.auth_required, True),
+            (TaskState.working, False),
+        ],
+        ids=["auth_required", "working"],
+    )
+    def test_needs_auth(self, task_by_state, state, expected):
+        """Test needs_auth is True only for auth_required state."""
+        result = SendResult(task=task_by_state[state])
+        assert result.needs_auth is expected
+
+    def test_needs_auth_when_no_state(self):
+        """Test needs_auth returns False when no task or message."""
+        result = SendResult()
+        assert result.needs_auth is False
+
     def test_context_id_from_task(self):
         """Test context_id is derived from task."""
         result = SendResult(task=_make_task(TaskState.completed, context_id="ctx-456"))
         assert result.context_id == "ctx-456"
 
-    def test_context_id_from_message(self):
+    def test_context_id_from_message(self, agent_message):
         """Test context_id is derived from message when no task."""
-        result = SendResult(message=_make_message(context_id="ctx-789"))
+        result = SendResult(message=agent_message)
         assert result.context_id == "ctx-789"
 
     def test_task_id_from_task(self):
@@ -96,32 +207,31 @@ class TestSendResult:
         result = SendResult(task=_make_task(TaskState.completed, task_id="task-456"))
         assert result.task_id == "task-456"
 
-    def test_task_id_from_message(self):
+    def test_task_id_from_message(self, agent_message):
         """Test task_id is derived from message when no task."""
-        result = SendResult(message=_make_message(task_id="task-789"))
+        result = SendResult(message=agent_message)
         assert result.task_id == "task-789"
 
-    def test_state_from_task(self):
+    def test_state_from_task(self, task_by_state):
         """Test state is derived from task status."""
-        result = SendResult(task=_make_task(TaskState.working))
+        result = SendResult(task=task_by_state[TaskState.working])
         assert result.state == TaskState.working
 
 
 class TestStreamEvent:
     """Tests for StreamEvent dataclass."""
 
-    def test_create_message_event(self):
+    def test_create_message_event(self, agent_message):
         """Test creating a message event with message object."""
-        msg = _make_message(context_id="ctx-123", task_id="task-456")
         event = StreamEvent(
             event_type="message",
-            message=msg,
+            message=agent_message,
             text="Hello, world!",
         )
 
         assert event.event_type == "message"
-        assert event.context_id == "ctx-123"
-        assert event.task_id == "task-456"
+        assert event.context_id == "ctx-789"
+        assert event.task_id == "task-789"
         assert event.text == "Hello, world!"
 
     def test_create_status_event(self):
@@ -187,104 +297,62 @@ class TestExtractTextFromMessageParts:
 
     def test_extract_from_text_part_with_root(self):
         """Test extracting from TextPart wrapped in Part."""
-        parts = [Part(root=TextPart(text="Hello, world!"))]
-        result = extract_text_from_message_parts(parts)
+        result = extract_text_from_message_parts(list(_parts("Hello, world!")))
         assert result == "Hello, world!"
 
+    def test_extract_from_single_non_text_part(self):
+        """Test extracting from a single non-text part returns empty string."""
+        parts = [Part(root=DataPart(data={"key": "value"}))]
+        result = extract_text_from_message_parts(parts)
+        assert result == ""
+
     def test_extract_multiple_parts(self):
         """Test extracting from multiple parts joins with newlines."""
-        parts = [
-            Part(root=TextPart(text="First line")),
-            Part(root=TextPart(text="Second line")),
-        ]
-        result = extract_text_from_message_parts(parts)
+        result = extract_text_from_message_parts(
+            list(_parts("First line", "Second line"))
+        )
         assert result == "First line\nSecond line"
 
 
 class TestTerminalStates:
     """Tests for terminal state constants."""
 
-    def test_terminal_states_include_completed(self):
-        """Test that completed is a terminal state."""
-        assert TaskState.completed in TERMINAL_TASK_STATES
-
-    def test_terminal_states_include_canceled(self):
-        """Test that canceled is a terminal state."""
-        assert TaskState.canceled in TERMINAL_TASK_STATES
-
-    def test_terminal_states_include_failed(self):
-        """Test that failed is a terminal state."""
-        assert TaskState.failed in TERMINAL_TASK_STATES
-
-    def test_terminal_states_include_rejected(self):
-        """Test that rejected is a terminal state."""
-        assert TaskState.rejected in TERMINAL_TASK_STATES
-
-    def test_working_is_not_terminal(self):
-        """Test that working is not a terminal state."""
-        assert TaskState.working not in TERMINAL_TASK_STATES
+    @pytest.mark.parametrize("state,is_terminal", _TERMINAL_CASES)
+    def test_terminal_membership(self, state, is_terminal):
+        """Test which states are treated as terminal."""
+        assert (state in TERMINAL_TASK_STATES) is is_terminal
 
-
-class TestSendResultNeedsAuth:
-    """Tests for SendResult.needs_auth property."""
-
-    def test_needs_auth_when_auth_required(self):
-        """Test needs_auth returns True for auth_required state."""
-        result = SendResult(task=_make_task(TaskState.auth_required))
-        assert result.needs_auth is True
-
-    def test_needs_auth_when_working(self):
-        """Test needs_auth returns False for working state."""
-        result = SendResult(task=_make_task(TaskState.working))
-        assert result.needs_auth is False
-
-    def test_needs_auth_when_no_state(self):
-        """Test needs_auth returns False when no task or message."""
-        result = SendResult()
-        assert result.needs_auth is False
+    def test_terminal_states_is_frozenset(self):
+        """Test that terminal states are an immutable set."""
+        assert isinstance(TERMINAL_TASK_STATES, frozenset)
 
 
 class TestStreamEventStatusFields:
     """Additional tests for StreamEvent with TaskStatusUpdateEvent."""
 
-    def test_context_id_from_status_event(self):
-        """Test context_id derived from status update event."""
-        from a2a.types import TaskStatusUpdateEvent, TaskStatus
-
-        status_event = TaskStatusUpdateEvent(
-            task_id="task-123",
-            context_id="ctx-status",
-            final=False,
-            status=TaskStatus(state=TaskState.working),
-        )
-        event = StreamEvent(event_type="status", status=status_event)
-        assert event.context_id == "ctx-status"
-
-    def test_task_id_from_status_event(self):
-        """Test task_id derived from status update event."""
-        from a2a.types import TaskStatusUpdateEvent, TaskStatus
-
-        status_event = TaskStatusUpdateEvent(
+    @pytest.fixture(scope="class")
+    def status_event(self):
+        """Create a status update event shared by the class."""
+        return TaskStatusUpdateEvent(
             task_id="task-from-status",
-            context_id="ctx-123",
+            context_id="ctx-status",
             final=False,
             status=TaskStatus(state=TaskState.working),
         )
-        event = StreamEvent(event_type="status", status=status_event)
-        assert event.task_id == "task-from-status"
 
-    def test_state_from_status_event(self):
-        """Test state derived from status update event."""
-        from a2a.types import TaskStatusUpdateEvent, TaskStatus
-
-        status_event = TaskStatusUpdateEvent(
-            task_id="task-123",
-            context_id="ctx-123",
-            final=False,
-            status=TaskStatus(state=TaskState.working),
-        )
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("context_id", "ctx-status"),
+            ("task_id", "task-from-status"),
+            ("state", TaskState.working),
+        ],
+        ids=["context_id", "task_id", "state"],
+    )
+    def test_field_from_status_event(self, status_event, attr, expected):
+        """Test fields are derived from the status update event."""
         event = StreamEvent(event_type="status", status=status_event)
-        assert event.state == TaskState.working
+        assert getattr(event, attr) == expected
 
 
 class TestStreamEventArtifact:
@@ -292,8 +360,6 @@ class TestStreamEventArtifact:
 
     def test_context_id_from_artifact(self):
         """Test context_id derived from artifact event."""
-        from a2a.types import TaskArtifactUpdateEvent, Artifact
-
         artifact_event = TaskArtifactUpdateEvent(
             task_id="task-123",
             context_id="ctx-artifact",
@@ -307,8 +373,6 @@ class TestStreamEventArtifact:
 
     def test_task_id_from_artifact(self):
         """Test task_id derived from artifact event."""
-        from a2a.types import TaskArtifactUpdateEvent, Artifact
-
         artifact_event = TaskArtifactUpdateEvent(
             task_id="task-artifact",
             context_id="ctx-123",
@@ -338,115 +402,26 @@ class TestTaskResultState:
 class TestExtractTextFromTask:
     """Tests for extract_text_from_task function."""
 
-    def test_extract_from_task_with_artifacts(self):
+    def test_extract_from_task_with_artifacts(self, task_with_artifact):
         """Test extracting text from task artifacts."""
-        from a2a_handler.service import extract_text_from_task
-        from a2a.types import Artifact
-
-        task = Task(
-            id="task-123",
-            context_id="ctx-123",
-            status=TaskStatus(state=TaskState.completed),
-            artifacts=[
-                Artifact(
-                    artifact_id="art-1",
-                    parts=[Part(root=TextPart(text="Artifact text"))],
-                )
-            ],
-        )
-
-        result = extract_text_from_task(task)
-        assert result == "Artifact text"
+        assert extract_text_from_task(task_with_artifact) == "Artifact text"
 
-    def test_extract_from_task_with_history_no_artifacts(self):
+    def test_extract_from_task_with_history_no_artifacts(self, task_with_history):
         """Test extracting text from task history when no artifacts."""
-        from a2a_handler.service import extract_text_from_task
-
-        task = Task(
-            id="task-123",
-            context_id="ctx-123",
-            status=TaskStatus(state=TaskState.completed),
-            artifacts=[],
-            history=[
-                Message(
-                    message_id="msg-1",
-                    role=Role.agent,
-                    parts=[Part(root=TextPart(text="History text"))],
-                    context_id="ctx-123",
-                )
-            ],
-        )
-
-        result = extract_text_from_task(task)
-        assert result == "History text"
+        assert extract_text_from_task(task_with_history) == "History text"
 
-    def test_extract_prefers_artifacts_over_history(self):
+    def test_extract_prefers_artifacts_over_history(self, task_with_both):
         """Test that artifacts take precedence over history."""
-        from a2a_handler.service import extract_text_from_task
-        from a2a.types import Artifact
-
-        task = Task(
-            id="task-123",
-            context_id="ctx-123",
-            status=TaskStatus(state=TaskState.completed),
-            artifacts=[
-                Artifact(
-                    artifact_id="art-1",
-                    parts=[Part(root=TextPart(text="Artifact text"))],
-                )
-            ],
-            history=[
-                Message(
-                    message_id="msg-1",
-                    role=Role.agent,
-                    parts=[Part(root=TextPart(text="History text"))],
-                    context_id="ctx-123",
-                )
-            ],
-        )
-
-        result = extract_text_from_task(task)
+        result = extract_text_from_task(task_with_both)
         assert result == "Artifact text"
         assert "History text" not in result
 
-    def test_extract_ignores_user_messages_in_history(self):
+    def test_extract_ignores_user_messages_in_history(self, task_with_user_and_agent):
         """Test that user messages in history are ignored."""
-        from a2a_handler.service import extract_text_from_task
-
-        task = Task(
-            id="task-123",
-            context_id="ctx-123",
-            status=TaskStatus(state=TaskState.completed),
-            artifacts=[],
-            history=[
-                Message(
-                    message_id="msg-1",
-                    role=Role.user,
-                    parts=[Part(root=TextPart(text="User text"))],
-                    context_id="ctx-123",
-                ),
-                Message(
-                    message_id="msg-2",
-                    role=Role.agent,
-                    parts=[Part(root=TextPart(text="Agent text"))],
-                    context_id="ctx-123",
-                ),
-            ],
-        )
-
-        result = extract_text_from_task(task)
+        result = extract_text_from_task(task_with_user_and_agent)
         assert result == "Agent text"
         assert "User text" not in result
 
-    def test_extract_from_empty_task(self):
+    def test_extract_from_empty_task(self, task_by_state):
         """Test extracting from task with no artifacts or history."""
-        from a2a_handler.service import extract_text_from_task
-
-        task = Task(
-            id="task-123",
-            context_id="ctx-123",
-            status=TaskStatus(state=TaskState.completed),
-        )
-
-        result = extract_text_from_task(task)
-        assert result == ""
+        assert extract_text_from_task(task_by_state[TaskState.completed]) == ""
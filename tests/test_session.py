@@ -1,11 +1,26 @@
 """Tests for the session state management module."""
 
-import tempfile
-from pathlib import Path
+import json
+
+import pytest
 
 from a2a_handler.session import AgentSession, SessionStore
 
 
+@pytest.fixture(scope="module")
+def saved_session_directory(tmp_path_factory):
+    """Save one session to disk once for the load tests to read."""
+    session_directory = tmp_path_factory.mktemp("sessions")
+    store = SessionStore(session_directory=session_directory)
+    store.sessions["http://localhost:8000"] = AgentSession(
+        agent_url="http://localhost:8000",
+        context_id="ctx-123",
+        task_id="task-456",
+    )
+    store.save()
+    return session_directory
+
+
 class TestAgentSession:
     """Tests for AgentSession dataclass."""
 
@@ -29,41 +44,35 @@ class TestAgentSession:
         assert session.context_id == "ctx-123"
         assert session.task_id == "task-456"
 
-    def test_update_context_id(self):
-        """Test updating context_id."""
-        session = AgentSession(agent_url="http://localhost:8000")
-        session.update(context_id="new-context")
-
-        assert session.context_id == "new-context"
-        assert session.task_id is None
-
-    def test_update_task_id(self):
-        """Test updating task_id."""
-        session = AgentSession(agent_url="http://localhost:8000")
-        session.update(task_id="new-task")
-
-        assert session.context_id is None
-        assert session.task_id == "new-task"
-
-    def test_update_both_ids(self):
-        """Test updating both context_id and task_id."""
-        session = AgentSession(agent_url="http://localhost:8000")
-        session.update(context_id="ctx-1", task_id="task-1")
-
-        assert session.context_id == "ctx-1"
-        assert session.task_id == "task-1"
-
-    def test_update_preserves_existing_values_when_none_passed(self):
-        """Test that update preserves existing values when None is passed."""
+    @pytest.mark.parametrize(
+        "initial,update_kwargs,expected",
+        [
+            ((None, None), {"context_id": "new-context"}, ("new-context", None)),
+            ((None, None), {"task_id": "new-task"}, (None, "new-task")),
+            (
+                (None, None),
+                {"context_id": "ctx-1", "task_id": "task-1"},
+                ("ctx-1", "task-1"),
+            ),
+            (
+                ("existing-ctx", "existing-task"),
+                {},
+                ("existing-ctx", "existing-task"),
+            ),
+        ],
+        ids=["context-id", "task-id", "both-ids", "preserve-existing"],
+    )
+    def test_update(self, initial, update_kwargs, expected):
+        """Test update sets provided IDs and preserves the rest."""
+        context_id, task_id = initial
         session = AgentSession(
             agent_url="http://localhost:8000",
-            context_id="existing-ctx",
-            task_id="existing-task",
+            context_id=context_id,
+            task_id=task_id,
         )
-        session.update()
+        session.update(**update_kwargs)
 
-        assert session.context_id == "existing-ctx"
-        assert session.task_id == "existing-task"
+        assert (session.context_id, session.task_id) == expected
 
 
 class TestSessionStore:
@@ -88,22 +97,21 @@ class TestSessionStore:
         session = store.get("http://localhost:8000")
         assert session.context_id == "existing-ctx"
 
-    def test_update_creates_and_updates_session(self):
+    def test_update_creates_and_updates_session(self, tmp_path):
         """Test that update creates and updates session."""
-        with tempfile.TemporaryDirectory() as temp_directory:
-            store = SessionStore(session_directory=Path(temp_directory))
-            session = store.update(
-                "http://localhost:8000",
-                context_id="new-ctx",
-                task_id="new-task",
-            )
-
-            assert session.context_id == "new-ctx"
-            assert session.task_id == "new-task"
-
-    def test_clear_specific_session(self):
+        store = SessionStore(session_directory=tmp_path)
+        session = store.update(
+            "http://localhost:8000",
+            context_id="new-ctx",
+            task_id="new-task",
+        )
+
+        assert session.context_id == "new-ctx"
+        assert session.task_id == "new-task"
+
+    def test_clear_specific_session(self, tmp_path):
         """Test clearing a specific session."""
-        store = SessionStore()
+        store = SessionStore(session_directory=tmp_path)
         store.sessions["http://localhost:8000"] = AgentSession(
             agent_url="http://localhost:8000"
         )
@@ -111,27 +119,24 @@ class TestSessionStore:
             agent_url="http://localhost:9000"
         )
 
-        with tempfile.TemporaryDirectory() as temp_directory:
-            store.session_directory = Path(temp_directory)
-            store.clear("http://localhost:8000")
+        store.clear("http://localhost:8000")
 
-            assert "http://localhost:8000" not in store.sessions
-            assert "http://localhost:9000" in store.sessions
+        assert "http://localhost:8000" not in store.sessions
+        assert "http://localhost:9000" in store.sessions
 
-    def test_clear_all_sessions(self):
+    def test_clear_all_sessions(self, tmp_path):
         """Test clearing all sessions."""
-        with tempfile.TemporaryDirectory() as temp_directory:
-            store = SessionStore(session_directory=Path(temp_directory))
-            store.sessions["http://localhost:8000"] = AgentSession(
-                agent_url="http://localhost:8000"
-            )
-            store.sessions["http://localhost:9000"] = AgentSession(
-                agent_url="http://localhost:9000"
-            )
+        store = SessionStore(session_directory=tmp_path)
+        store.sessions["http://localhost:8000"] = AgentSession(
+            agent_url="http://localhost:8000"
+        )
+        store.sessions["http://localhost:9000"] = AgentSession(
+            agent_url="http://localhost:9000"
+        )
 
-            store.clear()
+        store.clear()
 
-            assert len(store.sessions) == 0
+        assert len(store.sessions) == 0
 
     def test_list_all_sessions(self):
         """Test listing all sessions."""
@@ -146,40 +151,37 @@ class TestSessionStore:
         all_sessions = store.list_all()
         assert len(all_sessions) == 2
 
-    def test_save_and_load_sessions(self):
-        """Test saving and loading sessions from disk."""
-        with tempfile.TemporaryDirectory() as temp_directory:
-            store = SessionStore(session_directory=Path(temp_directory))
-            store.sessions["http://localhost:8000"] = AgentSession(
-                agent_url="http://localhost:8000",
-                context_id="ctx-123",
-                task_id="task-456",
-            )
-            store.save()
-
-            new_store = SessionStore(session_directory=Path(temp_directory))
-            new_store.load()
-
-            assert "http://localhost:8000" in new_store.sessions
-            loaded_session = new_store.sessions["http://localhost:8000"]
-            assert loaded_session.context_id == "ctx-123"
-            assert loaded_session.task_id == "task-456"
-
-    def test_load_nonexistent_file(self):
+    def test_save_writes_session_file(self, saved_session_directory):
+        """Test that save writes sessions to disk as JSON."""
+        session_file = saved_session_directory / "sessions.json"
+
+        assert json.loads(session_file.read_text()) == {
+            "http://localhost:8000": {"context_id": "ctx-123", "task_id": "task-456"}
+        }
+
+    def test_load_saved_sessions(self, saved_session_directory):
+        """Test loading sessions previously saved to disk."""
+        store = SessionStore(session_directory=saved_session_directory)
+        store.load()
+
+        assert "http://localhost:8000" in store.sessions
+        loaded_session = store.sessions["http://localhost:8000"]
+        assert loaded_session.context_id == "ctx-123"
+        assert loaded_session.task_id == "task-456"
+
+    def test_load_nonexistent_file(self, tmp_path):
         """Test loading from nonexistent file does nothing."""
-        with tempfile.TemporaryDirectory() as temp_directory:
-            store = SessionStore(session_directory=Path(temp_directory))
-            store.load()
+        store = SessionStore(session_directory=tmp_path)
+        store.load()
 
-            assert len(store.sessions) == 0
+        assert len(store.sessions) == 0
 
-    def test_load_invalid_json(self):
+    def test_load_invalid_json(self, tmp_path):
         """Test loading invalid JSON file handles gracefully."""
-        with tempfile.TemporaryDirectory() as temp_directory:
-            session_file = Path(temp_directory) / "sessions.json"
-            session_file.write_text("not valid json {{{")
+        session_file = tmp_path / "sessions.json"
+        session_file.write_text("not valid json {{{")
 
-            store = SessionStore(session_directory=Path(temp_directory))
-            store.load()
+        store = SessionStore(session_directory=tmp_path)
+        store.load()
 
-            assert len(store.sessions) == 0
+        assert len(store.sessions) == 0
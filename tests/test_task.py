@@ -1,21 +1,28 @@
 """Tests for task CLI commands."""
 
+import json
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from click.testing import CliRunner
-from a2a.types import Task, TaskState, TaskStatus, PushNotificationConfig
-
-from a2a_handler.cli.task import task
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+    Task,
+    TaskState,
+    TaskStatus,
+    PushNotificationConfig,
+    TaskPushNotificationConfig,
+)
+
+from a2a_handler.cli.task import _format_task_result, task
+from a2a_handler.common import Output
 from a2a_handler.service import TaskResult, StreamEvent
 
 
-@pytest.fixture
-def runner():
-    """Create a CLI runner."""
-    return CliRunner()
-
-
 def _make_task(
     state: TaskState = TaskState.completed,
     task_id: str = "task-123",
@@ -29,356 +36,262 @@ def _make_task(
     )
 
 
-class TestTaskGet:
-    """Tests for task get command."""
+_TASK_COMPLETED = _make_task(TaskState.completed)
+_TASK_CANCELED = _make_task(TaskState.canceled)
+_TASK_WORKING = _make_task(TaskState.working)
+
+_AGENT_CARD_JSON = AgentCard(
+    name="Test Agent",
+    description="A test agent",
+    url="http://localhost:8000",
+    version="1.0.0",
+    capabilities=AgentCapabilities(),
+    default_input_modes=["text/plain"],
+    default_output_modes=["text/plain"],
+    skills=[
+        AgentSkill(
+            id="test_skill",
+            name="Test Skill",
+            description="A test skill",
+            tags=["test"],
+        )
+    ],
+).model_dump(mode="json", by_alias=True, exclude_none=True)
 
-    def test_task_get_success(self, runner):
-        """Test successful task get command."""
-        mock_task = _make_task(TaskState.completed)
-        mock_result = TaskResult(task=mock_task, text="Task output text")
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.get_task.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(task, ["get", "http://localhost:8000", "task-123"])
-
-            assert result.exit_code == 0
-            assert "task-123" in result.output
-
-    def test_task_get_with_history_length(self, runner):
-        """Test task get with history length option."""
-        mock_task = _make_task(TaskState.completed)
-        mock_result = TaskResult(task=mock_task)
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.get_task.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task, ["get", "http://localhost:8000", "task-123", "-n", "5"]
-            )
+_RPC_RESULTS = {
+    "tasks/get": _TASK_COMPLETED.model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    ),
+    "tasks/cancel": _TASK_CANCELED.model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    ),
+}
 
-            assert result.exit_code == 0
-            mock_service.get_task.assert_called_once_with("task-123", 5)
-
-    def test_task_get_with_bearer_auth(self, runner):
-        """Test task get with bearer token override."""
-        mock_task = _make_task(TaskState.completed)
-        mock_result = TaskResult(task=mock_task)
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.get_task.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                [
-                    "get",
-                    "http://localhost:8000",
-                    "task-123",
-                    "--bearer",
-                    "my-token",
-                ],
-            )
 
-            assert result.exit_code == 0
-            # Verify the service was created with credentials
-            call_kwargs = mock_service_cls.call_args.kwargs
-            assert call_kwargs["credentials"] is not None
-
-    def test_task_get_with_api_key_auth(self, runner):
-        """Test task get with API key override."""
-        mock_task = _make_task(TaskState.completed)
-        mock_result = TaskResult(task=mock_task)
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.get_task.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                ["get", "http://localhost:8000", "task-123", "--api-key", "my-key"],
-            )
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI runner shared across tests."""
+    return CliRunner()
 
-            assert result.exit_code == 0
 
-    def test_task_get_connection_error(self, runner):
-        """Test task get handles connection errors gracefully."""
-        import httpx
+@pytest.fixture
+def mock_service():
+    """Patch the HTTP client and yield the mocked A2AService instance."""
+    with (
+        patch("a2a_handler.cli.task.build_http_client") as mock_client,
+        patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
+    ):
+        mock_http = AsyncMock()
+        mock_http.__aenter__.return_value = mock_http
+        mock_http.__aexit__.return_value = None
+        mock_client.return_value = mock_http
+        mock_service_cls.return_value = AsyncMock()
+        yield mock_service_cls.return_value
+
+
+@pytest.fixture(scope="module")
+def push_config():
+    """Create a push notification config shared by the notification tests."""
+    return TaskPushNotificationConfig(
+        task_id="task-123",
+        push_notification_config=PushNotificationConfig(
+            url="http://webhook.example.com",
+            token="secret-token",
+            id="config-id-123",
+        ),
+    )
 
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
 
-            mock_service = AsyncMock()
-            mock_service.get_task.side_effect = httpx.ConnectError("Connection refused")
-            mock_service_cls.return_value = mock_service
+@pytest.fixture
+def fake_agent():
+    """Serve canned agent responses to the real A2AService.
+
+    Only build_http_client is patched: it returns an httpx client backed by
+    a MockTransport that answers agent card lookups and JSON-RPC task calls.
+    Yields the list of JSON-RPC requests the agent received.
+    """
+    rpc_requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=_AGENT_CARD_JSON)
+
+        rpc_requests.append(request)
+        body = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "jsonrpc": "2.0",
+                "id": body["id"],
+                "result": _RPC_RESULTS[body["method"]],
+            },
+        )
 
-            result = runner.invoke(task, ["get", "http://localhost:8000", "task-123"])
+    transport = httpx.MockTransport(handle)
+    with patch(
+        "a2a_handler.cli.task.build_http_client",
+        side_effect=lambda: httpx.AsyncClient(transport=transport),
+    ):
+        yield rpc_requests
 
-            assert result.exit_code == 1
-            assert "Connection refused" in result.output
+
+class TestTaskGet:
+    """Tests for task get command."""
+
+    @pytest.mark.parametrize(
+        "extra_args,history_length,auth_header",
+        [
+            ([], None, None),
+            (["-n", "5"], 5, None),
+            (["--bearer", "my-token"], None, ("Authorization", "Bearer my-token")),
+            (["--api-key", "my-key"], None, ("X-API-Key", "my-key")),
+        ],
+        ids=["default", "history-length", "bearer", "api-key"],
+    )
+    def test_task_get(
+        self,
+        runner,
+        fake_agent,
+        extra_args,
+        history_length,
+        auth_header,
+    ):
+        """Test task get sends options through to the agent."""
+        result = runner.invoke(
+            task, ["get", "http://localhost:8000", "task-123", *extra_args]
+        )
+
+        assert result.exit_code == 0
+        assert "task-123" in result.output
+        (request,) = fake_agent
+        body = json.loads(request.content)
+        assert body["method"] == "tasks/get"
+        assert body["params"]["id"] == "task-123"
+        assert body["params"].get("historyLength") == history_length
+        if auth_header:
+            header_name, header_value = auth_header
+            assert request.headers[header_name] == header_value
+
+    def test_task_get_connection_error(self, runner, mock_service):
+        """Test task get handles connection errors gracefully."""
+        mock_service.get_task.side_effect = httpx.ConnectError("Connection refused")
+
+        result = runner.invoke(task, ["get", "http://localhost:8000", "task-123"])
+
+        assert result.exit_code == 1
+        assert "Connection refused" in result.output
 
 
 class TestTaskCancel:
     """Tests for task cancel command."""
 
-    def test_task_cancel_success(self, runner):
-        """Test successful task cancel command."""
-        mock_task = _make_task(TaskState.canceled)
-        mock_result = TaskResult(task=mock_task)
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.cancel_task.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task, ["cancel", "http://localhost:8000", "task-123"]
-            )
-
-            assert result.exit_code == 0
-            assert "canceled" in result.output.lower()
-
-    def test_task_cancel_with_bearer(self, runner):
-        """Test task cancel with bearer token."""
-        mock_task = _make_task(TaskState.canceled)
-        mock_result = TaskResult(task=mock_task)
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.cancel_task.return_value = mock_result
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                [
-                    "cancel",
-                    "http://localhost:8000",
-                    "task-123",
-                    "--bearer",
-                    "token",
-                ],
-            )
+    @pytest.mark.parametrize(
+        "extra_args,auth_header",
+        [
+            ([], None),
+            (["--bearer", "token"], ("Authorization", "Bearer token")),
+        ],
+        ids=["default", "bearer"],
+    )
+    def test_task_cancel(self, runner, fake_agent, extra_args, auth_header):
+        """Test task cancel with and without a bearer token."""
+        result = runner.invoke(
+            task, ["cancel", "http://localhost:8000", "task-123", *extra_args]
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
+        assert "canceled" in result.output.lower()
+        (request,) = fake_agent
+        body = json.loads(request.content)
+        assert body["method"] == "tasks/cancel"
+        assert body["params"]["id"] == "task-123"
+        if auth_header:
+            header_name, header_value = auth_header
+            assert request.headers[header_name] == header_value
 
 
 class TestTaskResubscribe:
     """Tests for task resubscribe command."""
 
-    def test_task_resubscribe_streams_events(self, runner):
+    def test_task_resubscribe_streams_events(self, runner, mock_service):
         """Test task resubscribe yields stream events."""
-        mock_task = _make_task(TaskState.working)
 
         async def mock_resubscribe(*args, **kwargs):
             yield StreamEvent(
                 event_type="status",
-                task=mock_task,
+                task=_TASK_WORKING,
             )
             yield StreamEvent(
                 event_type="artifact",
                 text="Some output text",
             )
 
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = MagicMock()
-            mock_service.resubscribe = mock_resubscribe
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task, ["resubscribe", "http://localhost:8000", "task-123"]
-            )
+        mock_service.resubscribe = mock_resubscribe
+
+        result = runner.invoke(
+            task, ["resubscribe", "http://localhost:8000", "task-123"]
+        )
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_task_resubscribe_with_api_key(self, runner):
+    def test_task_resubscribe_with_api_key(self, runner, mock_service):
         """Test task resubscribe with API key."""
-        mock_task = _make_task(TaskState.completed)
 
         async def mock_resubscribe(*args, **kwargs):
-            yield StreamEvent(event_type="status", task=mock_task)
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = MagicMock()
-            mock_service.resubscribe = mock_resubscribe
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                [
-                    "resubscribe",
-                    "http://localhost:8000",
-                    "task-123",
-                    "--api-key",
-                    "my-key",
-                ],
-            )
+            yield StreamEvent(event_type="status", task=_TASK_COMPLETED)
 
-            assert result.exit_code == 0
+        mock_service.resubscribe = mock_resubscribe
+
+        result = runner.invoke(
+            task,
+            [
+                "resubscribe",
+                "http://localhost:8000",
+                "task-123",
+                "--api-key",
+                "my-key",
+            ],
+        )
+
+        assert result.exit_code == 0
 
 
 class TestTaskNotificationSet:
     """Tests for task notification set command."""
 
-    def test_notification_set_success(self, runner):
-        """Test successful notification set command."""
-        from a2a.types import TaskPushNotificationConfig
+    @pytest.mark.parametrize(
+        "extra_args,token",
+        [
+            ([], None),
+            (["--token", "webhook-token"], "webhook-token"),
+        ],
+        ids=["default", "token"],
+    )
+    def test_notification_set(
+        self, runner, mock_service, push_config, extra_args, token
+    ):
+        """Test notification set with and without a webhook token."""
+        mock_service.set_push_config.return_value = push_config
 
-        mock_config = TaskPushNotificationConfig(
-            task_id="task-123",
-            push_notification_config=PushNotificationConfig(
-                url="http://webhook.example.com",
-                token="secret-token",
-            ),
+        result = runner.invoke(
+            task,
+            [
+                "notification",
+                "set",
+                "http://localhost:8000",
+                "task-123",
+                "--url",
+                "http://webhook.example.com",
+                *extra_args,
+            ],
         )
 
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.set_push_config.return_value = mock_config
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                [
-                    "notification",
-                    "set",
-                    "http://localhost:8000",
-                    "task-123",
-                    "--url",
-                    "http://webhook.example.com",
-                ],
-            )
-
-            assert result.exit_code == 0
-            assert "Push notification config set" in result.output
-
-    def test_notification_set_with_token(self, runner):
-        """Test notification set with authentication token."""
-        from a2a.types import TaskPushNotificationConfig
-
-        mock_config = TaskPushNotificationConfig(
-            task_id="task-123",
-            push_notification_config=PushNotificationConfig(
-                url="http://webhook.example.com",
-                token="webhook-token",
-            ),
+        assert result.exit_code == 0
+        assert "Push notification config set" in result.output
+        mock_service.set_push_config.assert_called_once_with(
+            "task-123", "http://webhook.example.com", token
         )
 
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.set_push_config.return_value = mock_config
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                [
-                    "notification",
-                    "set",
-                    "http://localhost:8000",
-                    "task-123",
-                    "--url",
-                    "http://webhook.example.com",
-                    "--token",
-                    "webhook-token",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_service.set_push_config.assert_called_once_with(
-                "task-123", "http://webhook.example.com", "webhook-token"
-            )
-
     def test_notification_set_requires_url(self, runner):
         """Test that notification set requires --url."""
         result = runner.invoke(
@@ -398,112 +311,54 @@ class TestTaskNotificationSet:
 class TestTaskNotificationGet:
     """Tests for task notification get command."""
 
-    def test_notification_get_success(self, runner):
-        """Test successful notification get command."""
-        from a2a.types import TaskPushNotificationConfig
-
-        mock_config = TaskPushNotificationConfig(
-            task_id="task-123",
-            push_notification_config=PushNotificationConfig(
-                url="http://webhook.example.com",
-                token="secret-token",
-                id="config-id-123",
-            ),
-        )
-
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.get_push_config.return_value = mock_config
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task, ["notification", "get", "http://localhost:8000", "task-123"]
-            )
-
-            assert result.exit_code == 0
-            assert "task-123" in result.output
-            assert "http://webhook.example.com" in result.output
-
-    def test_notification_get_with_config_id(self, runner):
-        """Test notification get with specific config ID."""
-        from a2a.types import TaskPushNotificationConfig
+    @pytest.mark.parametrize(
+        "extra_args,config_id",
+        [
+            ([], None),
+            (["--config-id", "specific-config-id"], "specific-config-id"),
+        ],
+        ids=["default", "config-id"],
+    )
+    def test_notification_get(
+        self, runner, mock_service, push_config, extra_args, config_id
+    ):
+        """Test notification get with and without a specific config ID."""
+        mock_service.get_push_config.return_value = push_config
 
-        mock_config = TaskPushNotificationConfig(
-            task_id="task-123",
-            push_notification_config=PushNotificationConfig(
-                url="http://webhook.example.com",
-                id="specific-config-id",
-            ),
+        result = runner.invoke(
+            task,
+            ["notification", "get", "http://localhost:8000", "task-123", *extra_args],
         )
 
-        with (
-            patch("a2a_handler.cli.task.build_http_client") as mock_client,
-            patch("a2a_handler.cli.task.A2AService") as mock_service_cls,
-        ):
-            mock_http = AsyncMock()
-            mock_http.__aenter__.return_value = mock_http
-            mock_http.__aexit__.return_value = None
-            mock_client.return_value = mock_http
-
-            mock_service = AsyncMock()
-            mock_service.get_push_config.return_value = mock_config
-            mock_service_cls.return_value = mock_service
-
-            result = runner.invoke(
-                task,
-                [
-                    "notification",
-                    "get",
-                    "http://localhost:8000",
-                    "task-123",
-                    "--config-id",
-                    "specific-config-id",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_service.get_push_config.assert_called_once_with(
-                "task-123", "specific-config-id"
-            )
+        assert result.exit_code == 0
+        assert "task-123" in result.output
+        assert "http://webhook.example.com" in result.output
+        mock_service.get_push_config.assert_called_once_with("task-123", config_id)
 
 
 class TestFormatTaskResult:
     """Tests for _format_task_result helper."""
 
-    def test_format_task_result_completed(self):
-        """Test formatting a completed task result."""
-        from a2a_handler.cli.task import _format_task_result
-        from a2a_handler.common import Output
-        from unittest.mock import MagicMock
+    @pytest.fixture
+    def output(self):
+        """Create a mock Output to record formatting calls."""
+        return MagicMock(spec=Output)
 
+    def test_format_task_result_completed(self, output):
+        """Test formatting a completed task result."""
         mock_task = _make_task(TaskState.completed, context_id="ctx-abc")
         result = TaskResult(task=mock_task, text="Output text here")
 
-        output = MagicMock(spec=Output)
         _format_task_result(result, output)
 
         output.field.assert_any_call("Task ID", "task-123", dim_value=True)
         output.state.assert_called_with("State", "completed")
         output.markdown.assert_called_with("Output text here")
 
-    def test_format_task_result_no_text(self):
+    def test_format_task_result_no_text(self, output):
         """Test formatting a task result without text."""
-        from a2a_handler.cli.task import _format_task_result
-        from a2a_handler.common import Output
-        from unittest.mock import MagicMock
-
-        mock_task = _make_task(TaskState.working)
-        result = TaskResult(task=mock_task, text="")
+        result = TaskResult(task=_TASK_WORKING, text="")
 
-        output = MagicMock(spec=Output)
         _format_task_result(result, output)
 
         output.markdown.assert_not_called()
@@ -5,7 +5,7 @@ import pytest
 from a2a_handler.tui import HandlerTUI
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_app_startup():
     """Test that the app starts up and displays the initial state."""
     app = HandlerTUI()
@@ -1,10 +1,10 @@
 """Tests for the agent card validation module."""
 
 import json
-import tempfile
-from pathlib import Path
 
+import pytest
 from a2a.types import AgentCard
+from pydantic import ValidationError
 
 from a2a_handler.validation import (
     ValidationSource,
@@ -37,58 +37,55 @@ def _minimal_valid_agent_card() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def valid_card_path(tmp_path_factory) -> str:
+    """Write the minimal valid agent card to a file once per session."""
+    path = tmp_path_factory.mktemp("cards") / "valid.json"
+    path.write_text(json.dumps(_minimal_valid_agent_card()))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def valid_card() -> AgentCard:
+    """Validate the minimal agent card once per module."""
+    return AgentCard.model_validate(_minimal_valid_agent_card())
+
+
 class TestAgentCardValidation:
     """Tests for agent card validation using the A2A SDK."""
 
-    def test_valid_minimal_card(self):
+    def test_valid_minimal_card(self, valid_card):
         """Test validation of a minimal valid agent card."""
-        data = _minimal_valid_agent_card()
-        card = AgentCard.model_validate(data)
-
-        assert card.name == "Test Agent"
-        assert card.description == "A test agent"
-        assert len(card.skills) == 1
+        assert valid_card.name == "Test Agent"
+        assert valid_card.description == "A test agent"
+        assert len(valid_card.skills) == 1
 
     def test_missing_required_field(self):
         """Test validation fails when required field is missing."""
         data = {"url": "http://localhost:8000"}
 
-        try:
+        with pytest.raises(ValidationError):
             AgentCard.model_validate(data)
-            assert False, "Expected validation to fail"
-        except Exception:
-            pass
 
     def test_skill_without_tags_fails_validation(self):
         """Test that skills without tags fail validation (tags are required in v0.3.0)."""
         data = _minimal_valid_agent_card()
         data["skills"] = [{"id": "test", "name": "Test", "description": "Test desc"}]
 
-        try:
+        with pytest.raises(ValidationError):
             AgentCard.model_validate(data)
-            assert False, "Expected validation to fail"
-        except Exception:
-            pass
 
 
 class TestValidateAgentCardFromFile:
     """Tests for validate_agent_card_from_file function."""
 
-    def test_valid_file(self):
+    def test_valid_file(self, valid_card_path):
         """Test validation of a valid agent card file."""
-        data = _minimal_valid_agent_card()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            f.flush()
+        result = validate_agent_card_from_file(valid_card_path)
 
-            result = validate_agent_card_from_file(f.name)
-
-            assert result.valid is True
-            assert result.source_type == ValidationSource.FILE
-            assert result.agent_card is not None
-
-            Path(f.name).unlink()
+        assert result.valid is True
+        assert result.source_type == ValidationSource.FILE
+        assert result.agent_card is not None
 
     def test_nonexistent_file(self):
         """Test validation fails for nonexistent file."""
@@ -98,84 +95,55 @@ class TestValidateAgentCardFromFile:
         assert len(result.issues) == 1
         assert result.issues[0].issue_type == "file_error"
 
-    def test_invalid_json_file(self):
+    def test_invalid_json_file(self, tmp_path):
         """Test validation fails for invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json {{{")
-            f.flush()
+        card_path = tmp_path / "agent.json"
+        card_path.write_text("not valid json {{{")
 
-            result = validate_agent_card_from_file(f.name)
+        result = validate_agent_card_from_file(str(card_path))
 
-            assert result.valid is False
-            assert len(result.issues) == 1
-            assert result.issues[0].issue_type == "json_error"
-
-            Path(f.name).unlink()
+        assert result.valid is False
+        assert len(result.issues) == 1
+        assert result.issues[0].issue_type == "json_error"
 
-    def test_directory_path(self):
+    def test_directory_path(self, tmp_path):
         """Test validation fails when path is a directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = validate_agent_card_from_file(tmpdir)
+        result = validate_agent_card_from_file(str(tmp_path))
 
-            assert result.valid is False
-            assert len(result.issues) == 1
-            assert result.issues[0].issue_type == "file_error"
+        assert result.valid is False
+        assert len(result.issues) == 1
+        assert result.issues[0].issue_type == "file_error"
 
 
 class TestValidationResult:
     """Tests for ValidationResult properties."""
 
-    def test_agent_name_from_card(self):
+    def test_agent_name_from_card(self, valid_card_path):
         """Test agent_name property returns name from agent card."""
-        data = _minimal_valid_agent_card()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            f.flush()
-
-            result = validate_agent_card_from_file(f.name)
-            assert result.agent_name == "Test Agent"
+        result = validate_agent_card_from_file(valid_card_path)
+        assert result.agent_name == "Test Agent"
 
-            Path(f.name).unlink()
-
-    def test_agent_name_from_raw_data(self):
+    def test_agent_name_from_raw_data(self, tmp_path):
         """Test agent_name property returns name from raw data when card is None."""
-        data = {"name": "Raw Agent", "url": "invalid"}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            f.flush()
-
-            result = validate_agent_card_from_file(f.name)
-            assert result.valid is False
-            assert result.agent_name == "Raw Agent"
+        card_path = tmp_path / "agent.json"
+        card_path.write_text(json.dumps({"name": "Raw Agent", "url": "invalid"}))
 
-            Path(f.name).unlink()
+        result = validate_agent_card_from_file(str(card_path))
+        assert result.valid is False
+        assert result.agent_name == "Raw Agent"
 
-    def test_protocol_version_from_sdk(self):
+    def test_protocol_version_from_sdk(self, valid_card_path):
         """Test protocol_version returns the SDK default version."""
-        data = _minimal_valid_agent_card()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            f.flush()
-
-            result = validate_agent_card_from_file(f.name)
-            assert result.protocol_version is not None
-            assert len(result.protocol_version) > 0
+        result = validate_agent_card_from_file(valid_card_path)
+        assert result.protocol_version is not None
+        assert len(result.protocol_version) > 0
 
-            Path(f.name).unlink()
-
-    def test_protocol_version_explicit(self):
+    def test_protocol_version_explicit(self, tmp_path):
         """Test protocol_version returns explicit version when set."""
         data = _minimal_valid_agent_card()
         data["protocolVersion"] = "2.0"
+        card_path = tmp_path / "agent.json"
+        card_path.write_text(json.dumps(data))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            f.flush()
-
-            result = validate_agent_card_from_file(f.name)
-            assert result.protocol_version == "2.0"
-
-            Path(f.name).unlink()
+        result = validate_agent_card_from_file(str(card_path))
+        assert result.protocol_version == "2.0"
@@ -45,65 +45,51 @@ class TestPushNotification:
 class TestPushNotificationStore:
     """Tests for PushNotificationStore."""
 
-    def test_add_notification(self):
-        """Test adding a notification to the store."""
+    @pytest.mark.parametrize(
+        "operations,expected_count",
+        [
+            ([("add", 1)], 1),
+            ([("add", 2)], 2),
+            ([("add", 1), ("clear", None)], 0),
+        ],
+        ids=["add-one", "add-two", "add-then-clear"],
+    )
+    def test_store_operations(self, operations, expected_count):
+        """Test the store contents after a sequence of add and clear calls."""
         store = PushNotificationStore()
-        notification = PushNotification(
-            timestamp=datetime.now(),
-            task_id="task-123",
-            payload={},
-            headers={},
-        )
-
-        store.add_notification(notification)
-        assert len(store.notifications) == 1
-
-    def test_get_all_notifications(self):
-        """Test getting all notifications."""
-        store = PushNotificationStore()
-        notification1 = PushNotification(
-            timestamp=datetime.now(),
-            task_id="task-1",
-            payload={},
-            headers={},
-        )
-        notification2 = PushNotification(
-            timestamp=datetime.now(),
-            task_id="task-2",
-            payload={},
-            headers={},
-        )
-
-        store.add_notification(notification1)
-        store.add_notification(notification2)
-
-        all_notifications = store.get_all_notifications()
-        assert len(all_notifications) == 2
-
-    def test_clear_all_notifications(self):
-        """Test clearing all notifications."""
-        store = PushNotificationStore()
-        notification = PushNotification(
-            timestamp=datetime.now(),
-            task_id="task-123",
-            payload={},
-            headers={},
-        )
 
-        store.add_notification(notification)
-        store.clear_all_notifications()
+        for operation, count in operations:
+            if operation == "add":
+                for index in range(count):
+                    store.add_notification(
+                        PushNotification(
+                            timestamp=datetime.now(),
+                            task_id=f"task-{index}",
+                            payload={},
+                            headers={},
+                        )
+                    )
+            else:
+                store.clear_all_notifications()
 
-        assert len(store.notifications) == 0
+        assert len(store.notifications) == expected_count
+        assert len(store.get_all_notifications()) == expected_count
 
 
 class TestWebhookApplication:
     """Tests for the webhook Starlette application."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
         """Create a test client for the webhook application."""
         application = create_webhook_application()
-        return TestClient(application)
+        with TestClient(application) as client:
+            yield client
+
+    @pytest.fixture(autouse=True)
+    def _clear_notifications(self, client):
+        """Reset the shared notification store before each test."""
+        client.post("/notifications/clear")
 
     def test_webhook_validation_get(self, client):
         """Test GET request for webhook validation."""